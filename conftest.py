@@ -1,17 +1,22 @@
-import os
+import pathlib
 
 import pytest
 
 
+# resolved test resources directories, keyed by test module path
+_TEST_RESOURCES_DIRS = {}
+
+
 @pytest.fixture(scope='module')
-def test_resources_dir():
+def test_resources_dir(request):
     """
     Yields the corresponding test resources directory for the module currently
     being tested.
     
     Parameters
     ----------
-    None
+    request : pytest.FixtureRequest
+        The pytest request object of the test module.
     
     Returns
     -------
@@ -19,12 +24,12 @@ def test_resources_dir():
         Path to test resources directory.
     """
 
-    current_file_path = os.path.abspath(os.getenv('PYTEST_CURRENT_TEST')).replace('\\', '/').replace('//', '/')
-    root_dir = current_file_path.split('tests/')[0]
-
-    test_file_path = current_file_path.split('tests/')[1]
-    test_file_path = '::'.join(test_file_path.split('::')[:-1])
-    test_file_path = test_file_path.replace('_test.py', '')
-    test_resources_dir = os.path.join(root_dir, 'tests/resources', test_file_path).replace('\\', '/').replace('//', '/')
-    yield test_resources_dir
+    module_path = request.module.__file__
+    if module_path not in _TEST_RESOURCES_DIRS:
+        test_file_path = pathlib.Path(module_path).resolve()
+        tests_dir = pathlib.Path(*test_file_path.parts[:test_file_path.parts.index('tests') + 1])
+        relative_path = test_file_path.relative_to(tests_dir)
+        resources_dir = tests_dir / 'resources' / relative_path.parent / relative_path.name.replace('_test.py', '')
+        _TEST_RESOURCES_DIRS[module_path] = resources_dir.as_posix()
+    yield _TEST_RESOURCES_DIRS[module_path]
 
@@ -1,5 +1,22 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-from .src.query_constructor import QueryConstructor
+from ._version import __version__
+
+
+__all__ = ['QueryConstructor', '__version__']
+
+
+def __getattr__(name):
+    # QueryConstructor (and with it geopandas, pandas, pyproj and shapely) is only
+    # imported on first access, so that 'import copernicusapi' itself stays cheap
+    if name == 'QueryConstructor':
+        from .src.query_constructor import QueryConstructor
+        globals()[name] = QueryConstructor
+        return QueryConstructor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
@@ -1,5 +1,19 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-from .query_constructor import QueryConstructor
+__all__ = ['QueryConstructor']
+
+
+def __getattr__(name):
+    # QueryConstructor is only imported on first access, so that importing other
+    # submodules (e.g. copernicusapi.src.response) does not load it
+    if name == 'QueryConstructor':
+        from .query_constructor import QueryConstructor
+        globals()[name] = QueryConstructor
+        return QueryConstructor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
@@ -16,11 +16,54 @@
 # 
 # ---
 
+import re
+from decimal import Decimal
+from functools import lru_cache
+
+
+# translation table removing separator characters from collection/product type aliases
+_ALIAS_SEPARATORS = str.maketrans('', '', '-_ ')
+
+
+# matches individual coordinate values in WKT strings; groups: integer part,
+# decimal places, exponent
+_WKT_NUMBER = re.compile(r'(-?\d+)(?:\.(\d+))?([eE][-+]?\d+)?')
+
+
+def _truncate_decimals(number_match : re.Match,
+                       decimals : int) -> str:
+    """
+    Cuts off the decimal places of a number matched in a WKT string without rounding.
+    
+    Parameters
+    ----------
+    number_match : re.Match
+        The match of the number (see _WKT_NUMBER).
+    decimals : int
+        The number of decimals to keep.
+    
+    Returns
+    -------
+    str
+        The number string with exactly the given number of decimals.
+    """
+
+    integer_str, decimals_str, exponent_str = number_match.groups()
+
+    # expand scientific notation to plain decimal notation first
+    if exponent_str is not None:
+        integer_str, _, decimals_str = format(Decimal(number_match.group()), 'f').partition('.')
+
+    if decimals <= 0:
+        return integer_str
+    return f"{integer_str}.{(decimals_str or '')[:decimals].ljust(decimals, '0')}"
+
+
+@lru_cache(maxsize=256)
 def reduce_wkt_coordinate_precision(wkt_str : str,
                                     decimals : int = 4) -> str:
     """
     Reduces the coordinate precision of a WKT string.
-    NOTE: currently only implemented for POINT and POLYGON objects.
     
     Parameters
     ----------
@@ -36,34 +79,21 @@ def reduce_wkt_coordinate_precision(wkt_str : str,
         The WKT string with reduced coordinate precision.
     """
 
-    if wkt_str.strip().startswith('POLYGON'):
-        coords_str = wkt_str.split('((')[-1].replace('))', '')
-        coords_str_pairs = coords_str.split(', ')
-        coords_pairs = [(float(x.split(' ')[0]), float(x.split(' ')[1])) for x in coords_str_pairs]
-
-        if len(coords_pairs) == 1:
-            return f'POINT ({coords_pairs[0][0]:.{decimals}f} {coords_pairs[0][1]:.{decimals}f})'
-        else:
-            coords_str_clipped = [f'{c[0]:.{decimals}f} {c[1]:.{decimals}f}' for c in coords_pairs]
-            return f"POLYGON (({', '.join(coords_str_clipped)}))"
-    elif wkt_str.strip().startswith('MULTIPOLYGON'):
-        coords_str = wkt_str.split('(((')[-1].replace(')))', '')
-        if ')),' in coords_str:
-            polygons_str = coords_str.split(')),')
-        else:
-            polygons_str = [coords_str]
-        polygons_str = [p.lstrip('( ').rstrip('), ') for p in polygons_str]
-        coords_str_pairs = [p.split(', ') for p in polygons_str]
-        coords_pairs = [[(float(x.split(' ')[0]), float(x.split(' ')[1])) for x in p] for p in coords_str_pairs]
-        coords_str_clipped = [[f'{c[0]:.{decimals}f} {c[1]:.{decimals}f}' for c in p] for p in coords_pairs]
-        polygons = [f"(({', '.join(p)}))" for p in coords_str_clipped]
-        return f"MULTIPOLYGON ({', '.join(polygons)})"
-    elif wkt_str.strip().startswith('POINT'):
-        coords_str = wkt_str.strip().split('(')[-1].replace(')', '')
-        coords_str_pair = coords_str.split(' ')
-        return f"POINT ({float(coords_str_pair[0]):.{decimals}f} {float(coords_str_pair[1]):.{decimals}f})"
+    return _WKT_NUMBER.sub(lambda m: _truncate_decimals(m, decimals), wkt_str.strip())
 
 
+# single-pass replacement table for characters with special meaning in ODATA queries
+_SPECIAL_CHARACTER_REPLACEMENTS = str.maketrans({"'": "''",
+                                                 '%': '%25',
+                                                 '+': '%2B',
+                                                 '/': '%2F',
+                                                 '?': '%3F',
+                                                 '#': '%23',
+                                                 '&': '%26'})
+_SPECIAL_CHARACTERS = frozenset(map(chr, _SPECIAL_CHARACTER_REPLACEMENTS))
+
+
+@lru_cache(maxsize=1024)
 def convert_special_characters(attr : str) -> str:
     """
     Converts special characters in query attributes to ensure compatibility with ODATA API.
@@ -79,17 +109,36 @@ def convert_special_characters(attr : str) -> str:
         The attribute with special characters replaced.
     """
 
-    attr = attr.replace("'", "''")
-    attr = attr.replace('%', "%25")
-    attr = attr.replace('+', "%2B")
-    attr = attr.replace('/', "%2F")
-    attr = attr.replace('?', "%3F")
-    attr = attr.replace('#', "%23")
-    attr = attr.replace('&', "%26")
+    # most attributes do not contain any special characters; skip translation
+    if _SPECIAL_CHARACTERS.isdisjoint(attr):
+        return attr
+
+    return attr.translate(_SPECIAL_CHARACTER_REPLACEMENTS)
 
-    return attr
 
+_COLLECTION_ALIAS_GROUPS = {('sentinel1', 's1'): 'SENTINEL-1',
+                            ('sentinel2', 's2'): 'SENTINEL-2',
+                            ('sentinel3', 's3'): 'SENTINEL-3',
+                            ('sentinel5p', 's5p'): 'SENTINEL-5P',
+                            ('sentinel6', 's6'): 'SENTINEL-6',
+                            ('sentinel1rtc', 's1rtc'): 'SENTINEL-1-RTC',
+                            ('globalmosaics', 'mosaics'): 'GLOBAL-MOSAICS',
+                            ('smos', ): 'SMOS',
+                            ('envisat', ): 'ENVISAT',
+                            ('landsat5', 'l5', 'ls5'): 'LANDSAT-5',
+                            ('landsat7', 'l7', 'ls7'): 'LANDSAT-7',
+                            ('landsat8', 'l8', 'ls8'): 'LANDSAT-8',
+                            ('copdem', 'copernicusdem'): 'COP-DEM',
+                            ('terraaqua', 'terra', 'aqua', 'modis'): 'TERRAAQUA',
+                            ('s2glc', 'globallandcover', 'glc'): 'S2GLC',
+                            ('ccm', 'copernicuscontributingmissions', 'contributingmissions'): 'CCM',
+                            }
 
+# flattened to a single alias -> collection name lookup table
+_COLLECTION_ALIASES = {alias: name for aliases, name in _COLLECTION_ALIAS_GROUPS.items() for alias in aliases}
+
+
+@lru_cache(maxsize=1024)
 def interpret_collection_name(collection_name : str) -> str:
     """
     Interprets collection name and translates different aliases to standard names
@@ -106,44 +155,107 @@ def interpret_collection_name(collection_name : str) -> str:
         Standard collection name for use in query.
     """
 
-    collection_name = collection_name.lower().replace('-', '').replace('_', '').replace(' ', '')
-
-    if collection_name in ('sentinel1', 's1'):
-        return 'SENTINEL-1'
-    elif collection_name in ('sentinel2', 's2'):
-        return 'SENTINEL-2'
-    elif collection_name in ('sentinel3', 's3'):
-        return 'SENTINEL-3'
-    elif collection_name in ('sentinel5p', 's5p'):
-        return 'SENTINEL-5P'
-    elif collection_name in ('sentinel6', 's6'):
-        return 'SENTINEL-6'
-    elif collection_name in ('sentinel1rtc', 's1rtc'):
-        return 'SENTINEL-1-RTC'
-    elif collection_name in ('globalmosaics', 'mosaics'):
-        return 'GLOBAL-MOSAICS'
-    elif collection_name in ('smos',):
-        return 'SMOS'
-    elif collection_name in ('envisat', ):
-        return 'ENVISAT'
-    elif collection_name in ('landsat5', 'l5', 'ls5'):
-        return 'LANDSAT-5'
-    elif collection_name in ('landsat7', 'l7', 'ls7'):
-        return 'LANDSAT-7'
-    elif collection_name in ('landsat8', 'l8', 'ls8'):
-        return 'LANDSAT-8'
-    elif collection_name in ('copdem', 'copernicusdem'):
-        return 'COP-DEM'
-    elif collection_name in ('terraaqua', 'terra', 'aqua', 'modis'):
-        return 'TERRAAQUA'
-    elif collection_name in ('s2glc', 'globallandcover', 'glc'):
-        return 'S2GLC'
-    elif collection_name in ('ccm', 'copernicuscontributingmissions', 'contributingmissions'):
-        return 'CCM'
-    else:
-        return None
+    collection_name = collection_name.lower().translate(_ALIAS_SEPARATORS)
+
+    return _COLLECTION_ALIASES.get(collection_name)
 
 
+_PRODUCT_TYPE_ALIAS_GROUPS = {
+                              # Sentinel-1
+                              ('cardbs', 'cardbackscatter', 'backscatter'): 'CARD-BS',
+                              ('cardcoh6', 'cardcoh', 'cardcoherence6', 'cardcoherence', 'coherence6', 'coherence'): 'CARD-COH6',
+                              ('raw', 'l0', 'level0'): 'RAW',
+                              ('slc', 'singlelookcomplex', 'level1slc', 'l1slc'): 'SLC',
+                              ('grd', 'groundrangedetected', 'level1grd', 'l1grd'): 'GRD',
+                              ('grdh', 'groundrangedetectedhighresolution', 'level1grdh', 'l1grdh'): 'GRDH',
+                              ('ocn', 'ocean', 'l2', 'level2'): 'OCN',
+
+                              # Sentinel-2
+                              ('l1c', 'level1c', 's2msi1c', 'toa'): 'S2MSI1C',
+                              ('l2a', 'level2a', 's2msi2a', 'boa'): 'S2MSI2A',
+
+                              # Sentinel-3 OLCI
+                              ('ol1efr', 'efr', 'olciefr'): 'OL_1_EFR___',
+                              ('ol1err', 'err', 'olcierr'): 'OL_1_ERR___',
+                              ('ol2wfr', 'wfr', 'olciwfr'): 'OL_2_WFR___',
+                              ('ol2wrr', 'wrr', 'olciwrr'): 'OL_2_WRR___',
+                              ('ol2lfr', 'lfr', 'olcilfr'): 'OL_2_LFR___',
+                              ('ol2lrr', 'lrr', 'olcilrr'): 'OL_2_LRR___',
+
+                              # Sentinel-3 SLSTR
+                              ('sl1rbt', 'rbt', 'slstrrbt'): 'SL_1_RBT___',
+                              ('sl2lst', 'lst', 'slstrlst'): 'SL_2_LST___',
+                              ('sl2wst', 'wst', 'slstrwst'): 'SL_2_WST___',
+                              ('sl2frp', 'frp', 'slstrfrp'): 'SL_2_FRP___',
+
+                              # Sentinel-3 SRAL (Altimetry)
+                              ('sr1sraa', 'sraa', 'sralsraa', 'l1a', 'level1a'): 'SR_1_SRA_A_',
+                              ('sr1sra', 'sra', 'sralsra', 'l1b', 'level1b'): 'SR_1_SRA___',
+                              ('sr1srabs', 'srabs', 'sralsrabs', 'l1bs', 'level1bs'): 'SR_1_SRA_BS',
+                              ('sr2lan', 'lan', 'srallan', 'land'): 'SR_2_LAN___',
+                              ('sr2lanhy', 'lanhy', 'srallanhy', 'hydrology'): 'SR_2_LAN_HY',
+                              ('sr2lansi', 'lansi', 'srallansi', 'seaice'): 'SR_2_LAN_SI',
+                              ('sr2lanli', 'lanli', 'srallanli', 'landice'): 'SR_2_LAN_LI',
+                              ('sr2wat', 'wat', 'sralwat', 'water'): 'SR_2_WAT___',
+
+                              # Sentinel-3 Synergy
+                              ('sy2syn', 'syn', 'synergy'): 'SY_2_SYN___',
+                              ('sy2vgp', 'vgp', 'vegetationp'): 'SY_2_VGP___',
+                              ('sy2vg1', 'vg1', 'vegetations1'): 'SY_2_VG1___',
+                              ('sy2v10', 'vg10', 'v10', 'vegetations10'): 'SY_2_V10___',
+                              ('aod', 'aerosol', 'aerosolopticaldepth', 'opticaldepth', 'sy2aod'): 'SY_2_AOD___',
+
+                              # Sentinel-5p (L1B radiance bands are added below)
+                              ('l1birsir', 'irsir'): 'L1B_IR_SIR',
+                              ('l1biruvn', 'iruvn'): 'L1B_IR_UVN',
+                              ('l2o3', 'o3'): 'L2__O3____',
+                              ('l2o3tcl', 'o3tcl'): 'L2__O3_TCL',
+                              ('l2o3pr', 'o3pr'): 'L2__O3__PR',
+                              ('l2no2', 'no2'): 'L2__NO2___',
+                              ('l2so2', 'so2'): 'L2__SO2___',
+                              ('l2ch4', 'ch4'): 'L2__CH4___',
+                              ('l2hcho', 'hcho'): 'L2__HCHO__',
+                              ('l2cloud', 'cloud'): 'L2__CLOUD_',
+                              ('l2aerai', 'aerai'): 'L2__AER_AI',
+                              ('l2aerlh', 'aerlh'): 'L2__AER_LH',
+
+                              # Sentinel-6
+                              ('s6mw2amr', 'mw2amr'): 'MW_2__AMR____',
+                              ('s6p41blr', 'p41blr'): 'P4_1B_LR_____',
+                              ('s6p41bhr', 'p41bhr'): 'P4_1B_HR_____',
+                              ('s6p42lr', 'p42lr'): 'P4_2__LR_____',
+                              ('s6p42hr', 'p42hr'): 'P4_2__HR_____',
+
+                              # Sentinel-1 RTC
+                              ('rtc', 'radiometricterraincorrected'): 'RTC',
+
+                              # Global Mosaics
+                              ('s2msil3mcq', 's2quarterly', 's2quarterlymosaic'): 'S2MSI_L3__MCQ',
+                              ('s1sarl3iwmcm', 's1iwmonthly', 's1iwmonthlymosaic'): 'S1SAR_L3_IW_MCM',
+                              ('s1sarl3dhmcm', 's1dhmonthly', 's1dhmonthlymosaic'): 'S1SAR_L3_DH_MCM',
+
+                              # Landsat-5
+                              ('l1g', 'level1g', 'ground', 'georeferenced'): 'L1G',
+                              ('l1t', 'level1t', 'terrain', 'terraincorrected'): 'L1T',
+
+                              # Landsat-7
+                              ('l1gt', 'level1gt', 'geocorrectedterrain', 'geocorrectedterraincorrected'): 'L1GT',
+                              ('gtc1p', 'globallandsurvey', 'panchromatic', 'globallandsurveypanchromatic'): 'GTC_1P',
+
+                              # Landsat-8
+                              ('l1tp', 'level1tp', 'precisionterrain', 'precisionterraincorrected'): 'L1TP',
+                              ('l2sp', 'level2sp', 'surfacereflectance', 'sr'): 'L2SP',
+                              }
+
+# Sentinel-5p L1B radiance bands 1-8
+_PRODUCT_TYPE_ALIAS_GROUPS.update({(f'l1bra{band_id}', f'ra{band_id}', f'l1brabd{band_id}'): f'L1B_RA_BD{band_id}'
+                                   for band_id in range(1, 9)})
+
+# flattened to a single alias -> product type name lookup table
+_PRODUCT_TYPE_ALIASES = {alias: name for aliases, name in _PRODUCT_TYPE_ALIAS_GROUPS.items() for alias in aliases}
+
+
+@lru_cache(maxsize=1024)
 def interpret_product_type(product_type_name : str) -> str:
     """
     Interprets product types and translates different aliases to standard names
@@ -160,155 +272,7 @@ def interpret_product_type(product_type_name : str) -> str:
         Standard product type name for use in query.
     """
 
-    product_type_name = product_type_name.lower().replace('-', '').replace('_', '').replace(' ', '')
-
-    # Sentinel-1
-    if product_type_name in ('cardbs', 'cardbackscatter', 'backscatter'):
-        return 'CARD-BS'
-    elif product_type_name in ('cardcoh6', 'cardcoh', 'cardcoherence6', 'cardcoherence', 'coherence6', 'coherence'):
-        return 'CARD-COH6'
-    elif product_type_name in ('raw', 'l0', 'level0'):
-        return 'RAW'
-    elif product_type_name in ('slc', 'singlelookcomplex', 'level1slc', 'l1slc'):
-        return 'SLC'
-    elif product_type_name in ('grd', 'groundrangedetected', 'level1grd', 'l1grd'):
-        return 'GRD'
-    elif product_type_name in ('grdh', 'groundrangedetectedhighresolution', 'level1grdh', 'l1grdh'):
-        return 'GRDH'
-    elif product_type_name in ('ocn', 'ocean', 'l2', 'level2'):
-        return 'OCN'
-
-    # Sentinel-2
-    elif product_type_name in ('l1c', 'level1c', 's2msi1c', 'toa'):
-        return 'S2MSI1C'
-    elif product_type_name in ('l2a', 'level2a', 's2msi2a', 'boa'):
-        return 'S2MSI2A'
-    
-    # Sentinel-3 OLCI
-    elif product_type_name in ('ol1efr', 'efr', 'olciefr'):
-        return 'OL_1_EFR___'
-    elif product_type_name in ('ol1err', 'err', 'olcierr'):
-        return 'OL_1_ERR___'
-    elif product_type_name in ('ol2wfr', 'wfr', 'olciwfr'):
-        return 'OL_2_WFR___'
-    elif product_type_name in ('ol2wrr', 'wrr', 'olciwrr'):
-        return 'OL_2_WRR___'
-    elif product_type_name in ('ol2lfr', 'lfr', 'olcilfr'):
-        return 'OL_2_LFR___'
-    elif product_type_name in ('ol2lrr', 'lrr', 'olcilrr'):
-        return 'OL_2_LRR___'
-    
-    # Sentinel-3 SLSTR
-    elif product_type_name in ('sl1rbt', 'rbt', 'slstrrbt'):
-        return 'SL_1_RBT___'
-    elif product_type_name in ('sl2lst', 'lst', 'slstrlst'):
-        return 'SL_2_LST___'
-    elif product_type_name in ('sl2wst', 'wst', 'slstrwst'):
-        return 'SL_2_WST___'
-    elif product_type_name in ('sl2frp', 'frp', 'slstrfrp'):
-        return 'SL_2_FRP___'
-    
-    # Sentinel-3 SRAL (Altimetry)
-    elif product_type_name in ('sr1sraa', 'sraa', 'sralsraa', 'l1a', 'level1a'):
-        return 'SR_1_SRA_A_'
-    elif product_type_name in ('sr1sra', 'sra', 'sralsra', 'l1b', 'level1b'):
-        return 'SR_1_SRA___'
-    elif product_type_name in ('sr1srabs', 'srabs', 'sralsrabs', 'l1bs', 'level1bs'):
-        return 'SR_1_SRA_BS'
-    elif product_type_name in ('sr2lan', 'lan', 'srallan', 'land'):
-        return 'SR_2_LAN___'
-    elif product_type_name in ('sr2lanhy', 'lanhy', 'srallanhy', 'hydrology'):
-        return 'SR_2_LAN_HY'
-    elif product_type_name in ('sr2lansi', 'lansi', 'srallansi', 'seaice'):
-        return 'SR_2_LAN_SI'
-    elif product_type_name in ('sr2lanli', 'lanli', 'srallanli', 'landice'):
-        return 'SR_2_LAN_LI'
-    elif product_type_name in ('sr2wat', 'wat', 'sralwat', 'water'):
-        return 'SR_2_WAT___'
-
-    # Sentinel-3 Synergy
-    elif product_type_name in ('sy2syn', 'syn', 'synergy'):
-        return 'SY_2_SYN___'
-    elif product_type_name in ('sy2vgp', 'vgp', 'vegetationp'):
-        return 'SY_2_VGP___'
-    elif product_type_name in ('sy2vg1', 'vg1', 'vegetations1'):
-        return 'SY_2_VG1___'
-    elif product_type_name in ('sy2v10', 'vg10', 'v10', 'vegetations10'):
-        return 'SY_2_V10___'
-    elif product_type_name in ('aod', 'aerosol', 'aerosolopticaldepth', 'opticaldepth', 'sy2aod'):
-        return 'SY_2_AOD___'
-    
-    # Sentinel-5p
-    elif product_type_name.startswith(('l1bra', 'ra')):
-        band_id = product_type_name[-1]
-        return f'L1B_RA_BD{band_id}'
-    elif product_type_name in ('l1birsir', 'irsir'):
-        return 'L1B_IR_SIR'
-    elif product_type_name in ('l1biruvn', 'iruvn'):
-        return 'L1B_IR_UVN'
-    elif product_type_name in ('l2o3', 'o3'):
-        return 'L2__O3____'
-    elif product_type_name in ('l2o3tcl', 'o3tcl'):
-        return 'L2__O3_TCL'
-    elif product_type_name in ('l2o3pr', 'o3pr'):
-        return 'L2__O3__PR'
-    elif product_type_name in ('l2no2', 'no2'):
-        return 'L2__NO2___'
-    elif product_type_name in ('l2so2', 'so2'):
-        return 'L2__SO2___'
-    elif product_type_name in ('l2ch4', 'ch4'):
-        return 'L2__CH4___'
-    elif product_type_name in ('l2hcho', 'hcho'):
-        return 'L2__HCHO__'
-    elif product_type_name in ('l2cloud', 'cloud'):
-        return 'L2__CLOUD_'
-    elif product_type_name in ('l2aerai', 'aerai'):
-        return 'L2__AER_AI'
-    elif product_type_name in ('l2aerlh', 'aerlh'):
-        return 'L2__AER_LH'
-    
-    # Sentinel-6
-    elif product_type_name in ('s6mw2amr', 'mw2amr'):
-        return 'MW_2__AMR____'
-    elif product_type_name in ('s6p41blr', 'p41blr'):
-        return 'P4_1B_LR_____'
-    elif product_type_name in ('s6p41bhr', 'p41bhr'):
-        return 'P4_1B_HR_____'
-    elif product_type_name in ('s6p42lr', 'p42lr'):
-        return 'P4_2__LR_____'
-    elif product_type_name in ('s6p42hr', 'p42hr'):
-        return 'P4_2__HR_____'
-    
-    # Sentinel-1 RTC
-    elif product_type_name in ('rtc', 'radiometricterraincorrected'):
-        return 'RTC'
-    
-    # Global Mosaics
-    elif product_type_name in ('s2msil3mcq', 's2quarterly', 's2quarterlymosaic'):
-        return 'S2MSI_L3__MCQ'
-    elif product_type_name in ('s1sarl3iwmcm', 's1iwmonthly', 's1iwmonthlymosaic'):
-        return 'S1SAR_L3_IW_MCM'
-    elif product_type_name in ('s1sarl3dhmcm', 's1dhmonthly', 's1dhmonthlymosaic'):
-        return 'S1SAR_L3_DH_MCM'
-
-    # Landsat-5
-    elif product_type_name in ('l1g', 'level1g', 'ground', 'georeferenced'):
-        return 'L1G'
-    elif product_type_name in ('l1t', 'level1t', 'terrain', 'terraincorrected'):
-        return 'L1T'
-    
-    # Landsat-7
-    elif product_type_name in ('l1gt', 'level1gt', 'geocorrectedterrain', 'geocorrectedterraincorrected'):
-        return 'L1GT'
-    elif product_type_name in ('gtc1p', 'globallandsurvey', 'panchromatic', 'globallandsurveypanchromatic'):
-        return 'GTC_1P'
-    
-    # Landsat-8
-    elif product_type_name in ('l1tp', 'level1tp', 'precisionterrain', 'precisionterraincorrected'):
-        return 'L1TP'
-    elif product_type_name in ('l2sp', 'level2sp', 'surfacereflectance', 'sr'):
-        return 'L2SP'
-    
-    else:
-        return None
+    product_type_name = product_type_name.lower().translate(_ALIAS_SEPARATORS)
+
+    return _PRODUCT_TYPE_ALIASES.get(product_type_name)
 
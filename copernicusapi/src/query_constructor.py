@@ -18,31 +18,28 @@
 
 # ## Load packages and modules
 
-import time
+import copy
 import requests
-import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import numpy as np
 import pandas as pd
 import geopandas as gpd
-import shapely.wkt
+import shapely
 from shapely import Point, Polygon, MultiPolygon, make_valid
 from shapely.ops import unary_union
 
 from ._constants import COLLECTIONS_SUPPORTING_CLOUD_COVER, COLLECTION_PRODUCT_TYPE_MATCHES
-from .response import get_checksums, get_cloud_cover, get_product_type, determine_group_tile_identifier
+from .response import get_product_values
 from .query import reduce_wkt_coordinate_precision, convert_special_characters, \
 interpret_collection_name, interpret_product_type
 from .vector import reproject_geometry
 
 
-# ---
-# ## Internal functions
-
-warnings.simplefilter(action='ignore', category=UserWarning)
-
-
 # ### Custom Errors
 
 class CopernicusQueryConstructorError(Exception):
@@ -84,25 +81,46 @@ class QueryConstructor:
         The maximum time to wait for a response from the API for any request/download
         sent (in seconds).
     max_retries : int; default=3
-        The number of retries in case of any issues during API requests.
+        The number of retries in case of connection issues or temporary server
+        errors during API requests.
     decimals : int; default=6
         The number of decimals to use in AOI coordinates (i.e. coordinate precision).
         NOTE: decimal places are cut off, not rounded.
+    max_workers : int; default=8
+        The maximum number of API requests sent in parallel (e.g. when retrieving
+        multiple products by name).
 
     Attributes
     ----------
+    _aoi_coverage : float
+        The cached result of the aoi_coverage property; reset to None whenever
+        the products or the AOI change.
+    _attribute_parts : list
+        Contains the attribute filter parts of the query as individual strings
+        (see add_attribute_filter).
     _n_filters : int
         The number of filters applied so far (to avoid checking too unspecific
         queries; see interactive parameter description above).
+    _products_sorted : gpd.GeoDataFrame
+        The products sorted by name as returned by the products property; reset
+        to None whenever new products are stored.
+    _query_cache : str
+        The query string as last assembled by the query property; reset to None
+        whenever a filter is added or changed.
     _query_parts : dict
         Contains the individual filter settings parts of the query as individual
-        strings.
+        strings (except attribute filters).
     _query_settings : dict
         Contains the individual filter settings provided by the user.
+    _session : requests.Session
+        The HTTP session used for all API requests (keeps connections alive
+        between requests).
     interactive : bool
         See __init__.
     max_retries : int
         See __init__.
+    max_workers : int
+        See __init__.
     request_timeout : int
         See __init__.
 
@@ -129,14 +147,29 @@ class QueryConstructor:
                  interactive : bool = False,
                  request_timeout : int = 60,
                  max_retries : int = 3,
-                 decimals : int = 6) -> None:
+                 decimals : int = 6,
+                 max_workers : int = 8) -> None:
 
         self.interactive = interactive
         self.request_timeout = request_timeout
         self.max_retries = max_retries
         self.decimals = decimals
+        self.max_workers = max_workers
+        self._session = requests.Session()
+        # connection pool large enough for parallel requests; failed connections
+        # and temporary server errors are retried (with exponential backoff)
+        # NOTE: the session is shared between worker threads. This is safe since it
+        # is only used for stateless GET requests (no auth, cookies or header changes
+        # after setup) and the underlying urllib3 connection pool is thread-safe
+        retries = Retry(total=max_retries, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=retries)
+        self._session.mount('https://', adapter)
+        self._aoi_coverage = None
         self._n_filters = 0
         self._products = None
+        self._products_sorted = None
+        self._attribute_parts = []
+        self._query_cache = None
         self._query_parts = {}
         self._query_settings = {'aoi': None,
                                 'collection': None,
@@ -166,41 +199,123 @@ class QueryConstructor:
             Contains all metadata from products, incl. additional columns produced.
         """
 
-        # create a simple pd.DataFrame from products list
-        df = pd.DataFrame(products)
+        # create a simple pd.DataFrame from products list; columns are determined
+        # once upfront (all fields in order of appearance) to avoid per-record
+        # column inference
+        columns = list(dict.fromkeys(key for product in products for key in product))
+        df = pd.DataFrame.from_records(products, columns=columns)
 
         # extract/unify some information from existing columns
         df['file_name'] = df['Name']
-        df['file_size'] = df['ContentLength'].apply(lambda x: x / 1024 / 1024)
-        df['group_tile_id'] = df['Name'].apply(determine_group_tile_identifier)
-        df['cloud_cover'] = df['Attributes'].apply(get_cloud_cover)
-        df['product_type'] = df['Attributes'].apply(get_product_type)
-        df[['checksum_md5', 'checksum_blake3']] = list(df['Checksum'].apply(get_checksums))
+        df['file_size'] = df['ContentLength'].to_numpy(dtype=np.float64) / (1024 * 1024)
+        # attributes, checksums and group/tile identifier in a single pass over all products
+        values = get_product_values(df)
+        df['group_tile_id'] = values['group_tile_id']
+        df['cloud_cover'] = values['cloud_cover']
+        df['product_type'] = values['product_type']
+        df['checksum_md5'] = values['checksum_md5']
+        df['checksum_blake3'] = values['checksum_blake3']
         df['download_url'] = df['Id'].apply(lambda x: f"https://download.dataspace.copernicus.eu/odata/v1/Products({x})/$value")
-        df['geometry'] = df['Footprint'].apply(lambda x: shapely.wkt.loads(x.split(';')[-1].strip("'\"")).buffer(0))
+        # parse all footprints in one vectorized call; strips the "geography'SRID=4326;" prefix
+        footprints_wkt = df['Footprint'].str.split(';').str[-1].str.strip("'\"")
+        df['geometry'] = make_valid(shapely.from_wkt(footprints_wkt.to_numpy()))
 
         # convert date strings to datetime objects; omitting milliseconds for compatibility
-        df['publication_date'] = df['PublicationDate'].apply(lambda x: datetime.strptime(x.split('.')[0], '%Y-%m-%dT%H:%M:%S'))
-        df['sensing_start_date'] = df['ContentDate'].apply(lambda x: datetime.strptime(x['Start'].split('.')[0], '%Y-%m-%dT%H:%M:%S'))
-        df['sensing_end_date'] = df['ContentDate'].apply(lambda x: datetime.strptime(x['End'].split('.')[0], '%Y-%m-%dT%H:%M:%S'))
+        df['publication_date'] = pd.to_datetime(df['PublicationDate'], format='ISO8601', utc=True).dt.tz_localize(None).dt.floor('s')
+        df['sensing_start_date'] = pd.to_datetime(df['ContentDate'].str.get('Start'), format='ISO8601', utc=True).dt.tz_localize(None).dt.floor('s')
+        df['sensing_end_date'] = pd.to_datetime(df['ContentDate'].str.get('End'), format='ISO8601', utc=True).dt.tz_localize(None).dt.floor('s')
                                              
         # convert to gpd.GeoDataFrame in WGS84
         gdf = gpd.GeoDataFrame(df, crs='epsg:4326')
 
         # additional geometry columns; calculating footprint_size and aoi_coverage
-        # in web mercator projection (3857)
-        gdf_web_mercator = gdf.to_crs('epsg:3857')
-        gdf['centroid'] = gdf['geometry'].centroid
-        gdf['footprint_size'] = gdf_web_mercator['geometry'].area / 1e6
+        # in web mercator projection (3857); only the geometries are reprojected
+        # (once, vectorized) instead of a copy of the full GeoDataFrame
+        geoms_web_mercator = reproject_geometry(df['geometry'].to_numpy(), 4326, 3857)
+        # centroids (in WGS84) directly from the geometry array; avoids geopandas'
+        # warning about centroids in a geographic CRS
+        gdf['centroid'] = gpd.GeoSeries(shapely.centroid(df['geometry'].to_numpy()), index=gdf.index, crs=gdf.crs)
+        gdf['footprint_size'] = shapely.area(geoms_web_mercator) / 1e6
 
         # AOI coverage
         if self.query_settings['aoi'] is not None:
             aoi = reproject_geometry(self.query_settings['aoi'], 4326, 3857)
-            gdf['aoi_coverage'] = gdf_web_mercator.intersection(aoi).area / aoi.area
+            # the prepared AOI speeds up the predicates; the intersection is only
+            # computed for footprints partially overlapping the AOI (footprints
+            # covering the AOI contribute its full area, disjoint ones none)
+            # NOTE: GeometryCollections (e.g. from make_valid) always take the
+            # intersection path, since GEOS < 3.13 does not support them in these
+            # predicates
+            shapely.prepare(aoi)
+            use_predicates = shapely.get_type_id(geoms_web_mercator) != shapely.GeometryType.GEOMETRYCOLLECTION
+            use_predicates &= shapely.get_type_id(aoi) != shapely.GeometryType.GEOMETRYCOLLECTION
+            covered = np.zeros(len(geoms_web_mercator), dtype=bool)
+            disjoint = np.zeros(len(geoms_web_mercator), dtype=bool)
+            covered[use_predicates] = shapely.covered_by(aoi, geoms_web_mercator[use_predicates])
+            disjoint[use_predicates] = shapely.disjoint(aoi, geoms_web_mercator[use_predicates])
+            partial = ~covered & ~disjoint
+            intersection_area = np.where(covered, aoi.area, 0.)
+            intersection_area[partial] = shapely.area(shapely.intersection(geoms_web_mercator[partial], aoi))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                gdf['aoi_coverage'] = intersection_area / aoi.area
         else:
             gdf['aoi_coverage'] = 1.
         
         return gdf
+
+    def _send_request(self,
+                      url : str) -> dict:
+        """
+        Sends a single request to the API. Retries in case of connection issues
+        or temporary server errors are handled by the session (see max_retries).
+
+        Parameters
+        ----------
+        url : str
+            The full request URL.
+
+        Returns
+        -------
+        dict
+            The raw result as returned by the API.
+        """
+
+        try:
+            result = self._session.get(url, timeout=self.request_timeout).json()
+        except requests.RequestException as e:
+            raise CopernicusQueryConstructorError(f'Request failed. -> {type(e).__name__}: {e}') from e
+        
+        if 'value' not in result.keys():
+            if 'Invalid value' in result:
+                raise CopernicusQueryConstructorError(f'Invalid value provided to result: {result}')
+            else:
+                raise CopernicusQueryConstructorError(f'Error or empty query result: {result}')
+        
+        return result
+
+    def _set_products(self,
+                      products : gpd.GeoDataFrame,
+                      result : dict) -> None:
+        """
+        Stores the products and raw result of the latest query; resets values
+        derived from previous products.
+        
+        Parameters
+        ----------
+        products : gpd.GeoDataFrame
+            The products as created by _create_products_geodataframe.
+        result : dict
+            The raw result as returned by the API.
+        
+        Returns
+        -------
+        None
+        """
+
+        self._products = products
+        self._products_sorted = None
+        self._latest_result = result
+        self._aoi_coverage = None
     
 
     ### PROPERTIES
@@ -221,8 +336,11 @@ class QueryConstructor:
         else:
             if self.query_settings['aoi'].area == 0:
                 return 1.
-            else:
-                return float(np.round(self._products.unary_union.intersection(self.query_settings['aoi']).area / self.query_settings['aoi'].area, 5))
+            # compute only once for the current products and AOI
+            if self._aoi_coverage is None:
+                products_union = shapely.unary_union(self._products['geometry'].to_numpy())
+                self._aoi_coverage = float(np.round(products_union.intersection(self.query_settings['aoi']).area / self.query_settings['aoi'].area, 5))
+            return self._aoi_coverage
     
     @property
     def api_response(self):
@@ -239,16 +357,17 @@ class QueryConstructor:
         send_query() and update internal attributes.
         In other words: always returns the current version of the products table
         and ensures the latest results are stored.
+        NOTE: the table (sorted by product name) is only created once for the
+        current products and reused on subsequent calls. A copy is returned so
+        that changes by the caller do not affect the stored table.
         """
 
         if self._products is None:
-            products, result = self.send_query()
-            products = products
-            self._latest_result = result
-            self._products = products
-            return products.sort_values('Name').reset_index(drop=True)
-        else:
-            return self._products.sort_values('Name').reset_index(drop=True)
+            _ = self.send_query()
+        if self._products_sorted is None:
+            self._products_sorted = self._products.sort_values('Name').reset_index(drop=True)
+
+        return self._products_sorted.copy()
     
     @property
     def query(self) -> str:
@@ -256,19 +375,13 @@ class QueryConstructor:
         Returns the current version of the query.
         """
 
-        query = 'https://catalogue.dataspace.copernicus.eu/odata/v1/Products?'
+        # only rebuild the query if filters have changed since last access
+        if self._query_cache is None:
+            # attribute filters are added after all other filters
+            filters = ' and '.join([*self._query_parts.values(), *self._attribute_parts])
+            self._query_cache = f'https://catalogue.dataspace.copernicus.eu/odata/v1/Products?$filter={filters}'
 
-        # add filters
-        query += '$filter='
-        other_filters = [self._query_parts[k] for k in self._query_parts.keys() if k != 'attributes']
-        query += ' and '.join(other_filters)
-
-        # handle attribute filters separately
-        if 'attributes' in self._query_parts.keys():
-            attributes_filter = ' and '.join(self._query_parts['attributes'])
-            query += f' and {attributes_filter}'
-
-        return query
+        return self._query_cache
     
     @property
     def query_settings(self) -> dict:
@@ -316,15 +429,17 @@ class QueryConstructor:
         if decimals is None:
             decimals = self.decimals
 
-        wkt_str = reduce_wkt_coordinate_precision(aoi.wkt, decimals=self.decimals)
+        wkt_str = reduce_wkt_coordinate_precision(aoi.wkt, decimals=decimals)
         if len(wkt_str) > 2000:
             print(f'AOI WKT string is very long ({len(wkt_str)}). Consider simplifying the AOI polygon to reduce risk of exceeding query string limit.')
         print(f'Adding AOI filter: {wkt_str}')
         # only increment filter count if the same filter has not already been set before
-        if 'aoi' not in self._query_parts.keys():
+        if 'aoi' not in self._query_parts:
             self._n_filters += 1
         self._query_parts['aoi'] = f"ODATA.CSC.Intersects(area=geography'SRID=4326;{wkt_str}')"
+        self._query_cache = None
         self._query_settings['aoi'] = aoi
+        self._aoi_coverage = None
 
         if self.interactive and self._n_filters >= 3:
             _ = self.check_query()
@@ -379,11 +494,11 @@ class QueryConstructor:
         value = convert_special_characters(value)
 
         print(f'Adding attribute filter: {name} {operator} {value} ({attribute_type})')
-        if 'attributes' not in self._query_parts.keys():
-            self._query_parts['attributes'] = []
+        if self._query_settings['attributes'] is None:
             self._query_settings['attributes'] = []
 
-        self._query_parts['attributes'].append(f"Attributes/OData.CSC.{attribute_type.capitalize()}Attribute/any(att:att/Name eq '{name}' and att/OData.CSC.{attribute_type.capitalize()}Attribute/Value {operator} '{value}')")
+        self._query_cache = None
+        self._attribute_parts.append(f"Attributes/OData.CSC.{attribute_type.capitalize()}Attribute/any(att:att/Name eq '{name}' and att/OData.CSC.{attribute_type.capitalize()}Attribute/Value {operator} '{value}')")
         self._query_settings['attributes'].append((name, operator, value, attribute_type))
         self._n_filters += 1
 
@@ -422,9 +537,10 @@ class QueryConstructor:
 
         print(f'Adding cloud cover filter: {ccover_min} to {ccover_max}')
         # only increment filter count if the same filter has not already been set before
-        if 'cloud_cover' not in self._query_parts.keys():
+        if 'cloud_cover' not in self._query_parts:
             self._n_filters += 1
         self._query_parts['cloud_cover'] = f"Attributes/OData.CSC.DoubleAttribute/any(att:att/Name eq 'cloudCover' and att/OData.CSC.DoubleAttribute/Value ge {ccover_min:.2f}) and Attributes/OData.CSC.DoubleAttribute/any(att:att/Name eq 'cloudCover' and att/OData.CSC.DoubleAttribute/Value le {ccover_max:.2f})"
+        self._query_cache = None
         self._query_settings['cloud_cover'] = ccover
 
         if self.interactive and self._n_filters >= 3:
@@ -456,7 +572,7 @@ class QueryConstructor:
             # set of allowed product type names
             if COLLECTION_PRODUCT_TYPE_MATCHES[collection_name] is not None:
                 if product_type_name not in COLLECTION_PRODUCT_TYPE_MATCHES[collection_name]:
-                    raise CopernicusQueryAttributeError(f"Collection '{collection_name}' does not support product type '{product_type_name}'. Valid options: {', '.join(COLLECTION_PRODUCT_TYPE_MATCHES[collection_name])}")
+                    raise CopernicusQueryAttributeError(f"Collection '{collection_name}' does not support product type '{product_type_name}'. Valid options: {', '.join(sorted(COLLECTION_PRODUCT_TYPE_MATCHES[collection_name]))}")
 
         # verify compatibility with collection
         if self._query_settings['cloud_cover'] is not None:
@@ -465,9 +581,10 @@ class QueryConstructor:
 
         print(f'Adding collection filter: {collection_name}')
         # only increment filter count if the same filter has not already been set before
-        if 'collection' not in self._query_parts.keys():
+        if 'collection' not in self._query_parts:
             self._n_filters += 1
         self._query_parts['collection'] = f"Collection/Name eq '{collection_name}'"
+        self._query_cache = None
         self._query_settings['collection'] = collection_name
 
         if self.interactive and self._n_filters >= 3:
@@ -499,13 +616,14 @@ class QueryConstructor:
             # set of allowed product type names
             if COLLECTION_PRODUCT_TYPE_MATCHES[collection_name] is not None:
                 if product_type_name not in COLLECTION_PRODUCT_TYPE_MATCHES[collection_name]:
-                    raise CopernicusQueryAttributeError(f"Product type '{product_type_name}' not available for collection '{collection_name}'. Valid options: {', '.join(COLLECTION_PRODUCT_TYPE_MATCHES[collection_name])}")
+                    raise CopernicusQueryAttributeError(f"Product type '{product_type_name}' not available for collection '{collection_name}'. Valid options: {', '.join(sorted(COLLECTION_PRODUCT_TYPE_MATCHES[collection_name]))}")
 
         print(f'Adding product type filter: {product_type_name}')
         # only increment filter count if the same filter has not already been set before
-        if 'product_type' not in self._query_parts.keys():
+        if 'product_type' not in self._query_parts:
             self._n_filters += 1
         self._query_parts['product_type'] = f"Attributes/OData.CSC.StringAttribute/any(att:att/Name eq 'productType' and att/OData.CSC.StringAttribute/Value eq '{product_type_name}')"
+        self._query_cache = None
         self._query_settings['product_type'] = product_type_name
 
         if self.interactive and self._n_filters >= 3:
@@ -542,9 +660,10 @@ class QueryConstructor:
 
         print(f'Adding publication date filter: {start_str} to {end_str}')
         # only increment filter count if the same filter has not already been set before
-        if 'publication_date' not in self._query_parts.keys():
+        if 'publication_date' not in self._query_parts:
             self._n_filters += 1
         self._query_parts['publication_date'] = f'PublicationDate ge {start_str} and PublicationDate le {end_str}'
+        self._query_cache = None
         self._query_settings['publication_date'] = (start, end)
 
         if self.interactive and self._n_filters >= 3:
@@ -581,9 +700,10 @@ class QueryConstructor:
 
         print(f'Adding sensing end date filter: {start_str} to {end_str}')
         # only increment filter count if the same filter has not already been set before
-        if 'sensing_end_date' not in self._query_parts.keys():
+        if 'sensing_end_date' not in self._query_parts:
             self._n_filters += 1
         self._query_parts['sensing_end_date'] = f'ContentDate/End ge {start_str} and ContentDate/End le {end_str}'
+        self._query_cache = None
         self._query_settings['sensing_end_date'] = (start, end)
 
         if self.interactive and self._n_filters >= 3:
@@ -620,13 +740,48 @@ class QueryConstructor:
 
         print(f'Adding sensing start date filter: {start_str} to {end_str}')
         # only increment filter count if the same filter has not already been set before
-        if 'sensing_start_date' not in self._query_parts.keys():
+        if 'sensing_start_date' not in self._query_parts:
             self._n_filters += 1
         self._query_parts['sensing_start_date'] = f'ContentDate/Start ge {start_str} and ContentDate/Start le {end_str}'
+        self._query_cache = None
         self._query_settings['sensing_start_date'] = (start, end)
 
         if self.interactive and self._n_filters >= 3:
             _ = self.check_query()
+
+    @contextmanager
+    def batch(self):
+        """
+        Context manager for adding several filters at once. In interactive mode,
+        the query is only checked once after all filters within the context have
+        been added (instead of after each filter).
+        
+        Parameters
+        ----------
+        None
+        
+        Yields
+        ------
+        QueryConstructor
+            The instance itself.
+
+        Examples
+        --------
+        >>> with query_constructor.batch():
+        ...     query_constructor.add_collection_filter('sentinel-2')
+        ...     query_constructor.add_product_type_filter('l2a')
+        ...     query_constructor.add_cloud_cover_filter(20)
+        """
+
+        interactive = self.interactive
+        self.interactive = False
+        try:
+            yield self
+        finally:
+            self.interactive = interactive
+
+        if self.interactive and self._n_filters >= 3:
+            _ = self.check_query()
     
     def check_query(self) -> int:
         """
@@ -644,7 +799,7 @@ class QueryConstructor:
             The number of products in the query.
         """
 
-        result = requests.get(self.query+'&$count=True&$top=1').json()
+        result = self._send_request(self.query+'&$count=True&$top=1')
         if '@odata.count' not in result.keys():
             raise CopernicusQueryConstructorError(f'Error or empty query result: {result}')
         n_products = result['@odata.count']
@@ -667,10 +822,16 @@ class QueryConstructor:
             New instance (copy).
         """
 
-        new_instance = QueryConstructor(self.interactive)
+        new_instance = QueryConstructor(interactive=self.interactive,
+                                        request_timeout=self.request_timeout,
+                                        max_retries=self.max_retries,
+                                        decimals=self.decimals,
+                                        max_workers=self.max_workers)
         new_instance._n_filters = self._n_filters
-        new_instance._query_parts = self._query_parts.copy()
-        new_instance._query_settings = self._query_settings.copy()
+        # deep copies to avoid sharing (mutable) filter lists with the original
+        new_instance._attribute_parts = copy.deepcopy(self._attribute_parts)
+        new_instance._query_parts = copy.deepcopy(self._query_parts)
+        new_instance._query_settings = copy.deepcopy(self._query_settings)
         return new_instance
     
     def query_by_name(self, 
@@ -700,13 +861,24 @@ class QueryConstructor:
         does not seem to allow to expand Assets and Attributes resulting in issues
         with subsequent steps.
         As a result, long lists of product names can lead to large numbers of 
-        API calls.
+        API calls. These are sent in parallel (see max_workers) using a single
+        HTTP session.
         """
         
-        # send the query, retrieve results
+        def _query_product(name):
+            # results without products (e.g. unknown names) are skipped below, so
+            # only failed requests are raised (same as in _send_request)
+            try:
+                return self._session.get(f"https://catalogue.dataspace.copernicus.eu/odata/v1/Products?&$count=True&$expand=Attributes&$expand=Assets&$filter=Name eq '{name}'", timeout=self.request_timeout).json()
+            except requests.RequestException as e:
+                raise CopernicusQueryConstructorError(f'Request failed for product {name}. -> {type(e).__name__}: {e}') from e
+
+        # send the queries in parallel (results are kept in order of product_names),
+        # retrieve results
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(_query_product, product_names))
         products = []
-        for name in product_names:
-            result = requests.get(f"https://catalogue.dataspace.copernicus.eu/odata/v1/Products?&$count=True&$expand=Attributes&$expand=Assets&$filter=Name eq '{name}'", timeout=self.request_timeout).json()
+        for result in results:
             if '@odata.count' in result.keys():
                 products.extend(result['value'])
 
@@ -714,12 +886,11 @@ class QueryConstructor:
         # internal attribautes
         if len(products) > 0:
             products = self._create_products_geodataframe(products)
-            total_file_size = np.sum(products['file_size'].values) / 1024
-            percentage_online = np.sum(products['Online']) / len(products)
+            total_file_size = products['file_size'].sum() / 1024
+            percentage_online = products['Online'].mean()
             print(f'Retrieved {len(products)} products ({total_file_size:.2f} GB, {percentage_online*100:.2f}% online).')
             # update internal attributes with current result
-            self._products = products
-            self._latest_result = result
+            self._set_products(products, result)
 
             return products, result
         else:
@@ -758,7 +929,9 @@ class QueryConstructor:
         Each query returns the number of products in the entire query result 
         ('count=True') but only n_entries are returned with each request. If n_entries
         is smaller than the total number of products in the query, this method will
-        auromatically run further API calls to retrieve all products.
+        auromatically run further API calls to retrieve all products. These calls
+        are sent in parallel (see max_workers), using the total number of products
+        to determine the offsets ('skip') of all remaining pages.
 
         Updates to internal attributes:
         Each time this method is called, it updates the internal _latest_result
@@ -768,48 +941,40 @@ class QueryConstructor:
         
         print('Sending query.')
         
-        # get query and add additional parameters as required
+        # get query and add additional parameters as required; the base query
+        # (incl. expand options) is shared by all page requests
         query = self.query
-        if skip is not None:
-            query += f'&$skip={skip}'
-        if n_entries is not None:
-            query += f'&$top={n_entries}'
         if orderby is not None:
             query += f'&$orderby={orderby[0]} {orderby[1]}'
+        query += '&$expand=Attributes&$expand=Assets&$expand=Locations'
+        skip = skip if skip is not None else 0
+        top = f'&$top={n_entries}' if n_entries is not None else ''
 
-        # send the query, retrieve results; attempt retries if API is unresponsive
-        for _ in range(self.max_retries):
-            try:
-                result = requests.get(query+'&$count=True&$expand=Attributes&$expand=Assets&$expand=Locations', timeout=self.request_timeout).json()
-                if '@odata.count' not in result.keys():
-                    if 'Invalid value' in result:
-                        raise CopernicusQueryConstructorError(f'Invalid value provided to result: {result}')
-                    else:
-                        raise CopernicusQueryConstructorError(f'Error or empty query result: {result}')
-                products = result['value']
-                break
-            except Exception as e:
-                print(f'Request failed (waiting for retry). -> {type(e).__name__}: {e}')
-                time.sleep(5)
-
-        # run additional API calls to obtain all pages of results if number of
-        # products is larger than n_entries
-        while '@odata.nextLink' in result.keys():
-            query = result['@odata.nextLink']
-            query = query.split('&$count')[0]
-            result = requests.get(query, timeout=self.request_timeout).json()
-            products.extend(result['value'])
+        # send the query, retrieve first page of results and total number of products
+        result = self._send_request(query + f'&$skip={skip}{top}&$count=True')
+        if '@odata.count' not in result.keys():
+            raise CopernicusQueryConstructorError(f'Error or empty query result: {result}')
+        products = result['value']
+
+        # run additional API calls to obtain all remaining pages of results (in
+        # parallel) if number of products is larger than n_entries
+        page_size = n_entries if n_entries is not None else len(products)
+        offsets = range(skip + page_size, result['@odata.count'], page_size) if page_size > 0 else []
+        if len(offsets) > 0:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                pages = list(executor.map(lambda offset: self._send_request(query + f'&$skip={offset}&$top={page_size}'), offsets))
+            for result in pages:
+                products.extend(result['value'])
         
         # if the full result contains any products, prepare results and update
         # internal attribautes
         if len(products) > 0:
             products = self._create_products_geodataframe(products)
-            total_file_size = np.sum(products['file_size'].values) / 1024
-            percentage_online = np.sum(products['Online']) / len(products)
+            total_file_size = products['file_size'].sum() / 1024
+            percentage_online = products['Online'].mean()
             print(f'Retrieved {len(products)} products ({total_file_size:.2f} GB, {percentage_online*100:.2f}% online).')
             # update internal attributes with current result
-            self._products = products
-            self._latest_result = result
+            self._set_products(products, result)
 
             return products, result
         else:
@@ -18,6 +18,7 @@
 # ---
 
 import numpy as np
+import pandas as pd
 
 
 def get_checksums(checksum_entry : list[dict]) -> tuple[str,str]:
@@ -38,20 +39,18 @@ def get_checksums(checksum_entry : list[dict]) -> tuple[str,str]:
         The BLAKE3 checksum. If not available, returns None.
     """
 
-    if len(checksum_entry) > 0:
-        if len(checksum_entry[0]) > 0:
-            if 'MD5' in [item['Algorithm'].upper() for item in checksum_entry]:
-                checksum_md5 = [item for item in checksum_entry if item['Algorithm'].upper() == 'MD5'][0]['Value']
-            else:
-                checksum_md5 = None
-            if 'BLAKE3' in [item['Algorithm'].upper() for item in checksum_entry]:
-                checksum_blake3 = [item for item in checksum_entry if item['Algorithm'].upper() == 'BLAKE3'][0]['Value']
-            else:
-                checksum_blake3 = None
-            return checksum_md5, checksum_blake3
-        else:
-            return None, None
-    else: return None, None
+    # single pass; the first entry of each algorithm is used
+    checksum_md5 = checksum_blake3 = None
+    for item in checksum_entry:
+        algorithm = item.get('Algorithm', '').upper()
+        if algorithm == 'MD5' and checksum_md5 is None:
+            checksum_md5 = item['Value']
+        elif algorithm == 'BLAKE3' and checksum_blake3 is None:
+            checksum_blake3 = item['Value']
+        if checksum_md5 is not None and checksum_blake3 is not None:
+            break
+
+    return checksum_md5, checksum_blake3
 
 
 def get_cloud_cover(attributes : list[dict]) -> float:
@@ -74,9 +73,8 @@ def get_cloud_cover(attributes : list[dict]) -> float:
         return np.nan
     else:
         for item in attributes:
-            if 'Name' in item.keys():
-                if item['Name'] == 'cloudCover':
-                    return float(item['Value'])
+            if item.get('Name') == 'cloudCover':
+                return float(item['Value'])
         return np.nan
 
 
@@ -100,12 +98,93 @@ def get_product_type(attributes : list[dict]) -> float:
         return np.nan
     else:
         for item in attributes:
-            if 'Name' in item.keys():
-                if item['Name'] == 'productType':
-                    return str(item['Value'])
+            if item.get('Name') == 'productType':
+                return str(item['Value'])
         return np.nan
 
 
+def _get_product_values(attributes : list[dict],
+                        checksum_entry : list[dict],
+                        name : str) -> tuple:
+    """
+    Retrieves cloud cover, product type, checksums and group/tile identifier of
+    a single product in one pass over its attributes and checksums.
+    
+    Parameters
+    ----------
+    attributes : list of dict
+        The attributes list as obtained from API result (from the 'Attributes' entry).
+    checksum_entry : list of dict
+        The content of the 'Checksum' entry for a product.
+    name : str
+        The full product name (from the 'Name' entry).
+    
+    Returns
+    -------
+    tuple
+        Cloud cover, product type, MD5 checksum, BLAKE3 checksum and group/tile
+        identifier. The first entry of each attribute/algorithm is used;
+        unavailable values are NaN.
+    """
+
+    cloud_cover = product_type = checksum_md5 = checksum_blake3 = None
+    for item in attributes:
+        attribute_name = item.get('Name')
+        if attribute_name == 'cloudCover' and cloud_cover is None:
+            cloud_cover = item['Value']
+        elif attribute_name == 'productType' and product_type is None:
+            product_type = item['Value']
+    for item in checksum_entry:
+        algorithm = item.get('Algorithm', '').upper()
+        if algorithm == 'MD5' and checksum_md5 is None:
+            checksum_md5 = item['Value']
+        elif algorithm == 'BLAKE3' and checksum_blake3 is None:
+            checksum_blake3 = item['Value']
+
+    # unavailable values as NaN (also keeps columns without any values numeric)
+    values = (cloud_cover, product_type, checksum_md5, checksum_blake3)
+    return (*(np.nan if value is None else value for value in values), determine_group_tile_identifier(name))
+
+
+def get_product_values(products : pd.DataFrame) -> pd.DataFrame:
+    """
+    Retrieves cloud cover, product type, checksums and group/tile identifier of
+    all products in a single pass (instead of one pass per value).
+    
+    Parameters
+    ----------
+    products : pd.DataFrame
+        The products as obtained from API result; must contain the 'Attributes',
+        'Checksum' and 'Name' entries.
+    
+    Returns
+    -------
+    pd.DataFrame
+        Contains the columns 'cloud_cover', 'product_type', 'checksum_md5',
+        'checksum_blake3' and 'group_tile_id' (same index as products). Values
+        are NaN if not available.
+    """
+
+    records = [_get_product_values(attributes, checksum_entry, name)
+               for attributes, checksum_entry, name in zip(products['Attributes'], products['Checksum'], products['Name'])]
+    values = pd.DataFrame.from_records(records, index=products.index,
+                                       columns=['cloud_cover', 'product_type', 'checksum_md5', 'checksum_blake3', 'group_tile_id'])
+    values['cloud_cover'] = pd.to_numeric(values['cloud_cover'], errors='coerce')
+
+    return values
+
+
+# functions retrieving the group/tile identifier from the name parts (split by '_')
+# and the full name of a product, by mission (first two characters of product name);
+# names are only split as far as needed (maximum number of splits; -1: no limit)
+_GROUP_TILE_IDENTIFIERS = {
+    'S1': (8, lambda name_parts, name: name_parts[7] if len(name_parts) > 7 else name_parts[-1]),
+    'S2': (6, lambda name_parts, name: '_'.join(name_parts[4:6])),
+    'S3': (12, lambda name_parts, name: '-' if '_SY_' in name else '_'.join(name_parts[10:12])),
+    'S5': (-1, lambda name_parts, name: name_parts[-4]),
+}
+
+
 def determine_group_tile_identifier(name : str) -> str:
     """
     Retrieves the unique group/tile identification information from a product name.
@@ -127,20 +206,9 @@ def determine_group_tile_identifier(name : str) -> str:
     products.
     """
 
-    name_parts = [p for p in name.split('_') if len(p) > 0]
-    name_parts = name.split('_')
-    if name.startswith('S1'):
-        if len(name_parts) > 7:
-            return name_parts[7]
-        else:
-            return name_parts[-1]
-    elif name.startswith('S2'):
-        return '_'.join(name_parts[4:6])
-    elif name.startswith('S3'):
-        if '_SY_' in name:
-            return '-'
-        else:
-            return '_'.join(name_parts[10:12])
-    elif name.startswith('S5'):
-        return name_parts[-4]
+    # single lookup of the mission; products of other missions are not split at all
+    mission = _GROUP_TILE_IDENTIFIERS.get(name[:2])
+    if mission is not None:
+        maxsplit, get_identifier = mission
+        return get_identifier(name.split('_', maxsplit), name)
 
@@ -16,37 +16,132 @@
 # 
 # ---
 
+from functools import lru_cache
+
+import numpy as np
 import pyproj
 import shapely
-from shapely.ops import transform
 
 
-def reproject_geometry(geom : shapely.geometry, 
-                       source_epsg : int, 
-                       target_epsg : int) -> shapely.geometry:
+@lru_cache(maxsize=64)
+def _get_epsg(crs : str|pyproj.CRS) -> int|str|pyproj.CRS:
     """
-    Projects a given vector geometry object from one CRS to another.
+    Determines the EPSG code of a CRS; cached so that each CRS input is only
+    parsed once.
+    
+    Parameters
+    ----------
+    crs : str or pyproj.CRS
+        The CRS in any format accepted by pyproj (e.g. 'EPSG:4326').
+
+    Returns
+    -------
+    int
+        The EPSG code. If the CRS has no EPSG code, crs is returned unchanged.
+    """
+
+    epsg = pyproj.CRS.from_user_input(crs).to_epsg()
+    return crs if epsg is None else epsg
+
+
+def _to_epsg(crs : int|float|str|dict|pyproj.CRS) -> int|str|pyproj.CRS:
+    """
+    Normalizes a CRS definition to its EPSG code (see _get_epsg). Handles the
+    inputs that cannot be passed to the cached lookup directly.
+    
+    Parameters
+    ----------
+    crs : int or float or str or dict or pyproj.CRS
+        The CRS as EPSG code or in any other format accepted by pyproj.
+
+    Returns
+    -------
+    int
+        The EPSG code. If the CRS has no EPSG code, it is returned unchanged (or
+        as pyproj.CRS for unhashable inputs like dicts).
+    """
+
+    if isinstance(crs, int):
+        return crs
+    # pyproj does not accept floats (e.g. 4326.0)
+    if isinstance(crs, float) and crs.is_integer():
+        return int(crs)
+    # unhashable inputs (e.g. dicts of PROJ parameters) cannot be cached as is
+    try:
+        hash(crs)
+    except TypeError:
+        crs = pyproj.CRS.from_user_input(crs)
+
+    return _get_epsg(crs)
+
+
+@lru_cache(maxsize=64)
+def _get_transformer(source_epsg : int,
+                     target_epsg : int) -> pyproj.Transformer:
+    """
+    Creates a transformer between two CRS; cached so that each combination of
+    source and target CRS is only created once.
     
     Parameters
     ----------
-    geom : shapely.geometry object
-        The geometry to reproject.
     source_epsg : int
-        The EPSG of the source projection of the geometry.
-    target_proj : str or int or float or pyproj.CRS
-        The EPSG of the target projection of the geometry.
+        The EPSG of the source projection.
+    target_epsg : int
+        The EPSG of the target projection.
 
     Returns
     -------
-    shapely.geometry object
-        Projected version of geometry.
+    pyproj.Transformer
+        The transformer (with x/y axis order, i.e. lon/lat for geographic CRS).
     """
 
+    return pyproj.Transformer.from_crs(source_epsg, target_epsg, always_xy=True)
+
+
+def reproject_geometry(geom : shapely.Geometry|np.ndarray, 
+                       source_epsg : int|float|str|dict|pyproj.CRS, 
+                       target_epsg : int|float|str|dict|pyproj.CRS) -> shapely.Geometry|np.ndarray:
+    """
+    Projects a given vector geometry object from one CRS to another.
+    
+    Parameters
+    ----------
+    geom : shapely.geometry object or np.ndarray of shapely.geometry objects
+        The geometry (or array of geometries) to reproject.
+    source_epsg : int or float or str or dict or pyproj.CRS
+        The EPSG (or any other CRS definition accepted by pyproj) of the source
+        projection of the geometry.
+    target_epsg : int or float or str or dict or pyproj.CRS
+        The EPSG (or any other CRS definition accepted by pyproj) of the target
+        projection of the geometry.
+
+    Returns
+    -------
+    shapely.geometry object or np.ndarray of shapely.geometry objects
+        Projected version of geometry (or array of geometries).
+    """
+
+    # normalize CRS definitions to EPSG codes, so that identical CRS given in
+    # different formats are recognized and share a cached transformer
+    source_epsg = _to_epsg(source_epsg)
+    target_epsg = _to_epsg(target_epsg)
+
     # skip process if source and target CRS are identical
     if source_epsg == target_epsg:
         return geom
 
-    project = pyproj.Transformer.from_crs(source_epsg, target_epsg, always_xy=True).transform
-    reprojected_geom = transform(project, geom)
+    # transform all coordinates (of all geometries) at once, instead of one
+    # callback per vertex
+    transformer = _get_transformer(source_epsg, target_epsg)
+    project = lambda coords: np.column_stack(transformer.transform(*coords.T))
+    has_z = shapely.has_z(geom)
+    if np.ndim(has_z) == 0:
+        return shapely.transform(geom, project, include_z=bool(has_z))
+
+    # 2D and 3D geometries are transformed separately, since include_z applies
+    # to all geometries of one call
+    reprojected_geom = np.empty_like(geom)
+    reprojected_geom[has_z] = shapely.transform(geom[has_z], project, include_z=True)
+    reprojected_geom[~has_z] = shapely.transform(geom[~has_z], project, include_z=False)
     return reprojected_geom
 
@@ -20,12 +20,17 @@ import pytest
 
 # ### Import packages and modules for unit testing
 
+import copy
+import re
 from datetime import datetime
+from functools import lru_cache
 
 import geopandas as gpd
-import numpy as np
+import pandas as pd
+import requests
+from shapely import Point, box
 
-from copernicusapi.src.query_constructor import QueryConstructor
+from copernicusapi.src.query_constructor import CopernicusQueryConstructorError, QueryConstructor
 
 
 # ### Setting up packages and modules (optional)
@@ -40,28 +45,96 @@ def configure_query_constructor(query_constructor, settings_dict):
     Configures a QueryConstructor instance based on provided settings.
     """
 
+    def add_attribute_filters(value):
+        for item in value:
+            query_constructor.add_attribute_filter(**item)
+
+    # one setter per settings key; date filters take (start, end) tuples and
+    # attribute filters a list of keyword dicts
+    setters = {'collection': query_constructor.add_collection_filter,
+               'publication_date': lambda value: query_constructor.add_publication_date_filter(*value),
+               'sensing_start_date': lambda value: query_constructor.add_sensing_start_date_filter(*value),
+               'sensing_end_date': lambda value: query_constructor.add_sensing_end_date_filter(*value),
+               'aoi': query_constructor.add_aoi_filter,
+               'cloud_cover': query_constructor.add_cloud_cover_filter,
+               'product_type': query_constructor.add_product_type_filter,
+               'attribute': add_attribute_filters,
+              }
     for key, value in settings_dict.items():
-        if key == 'collection':
-            query_constructor.add_collection_filter(value)
-        elif key == 'publication_date':
-            query_constructor.add_publication_date_filter(*value)
-        elif key == 'sensing_start_date':
-            query_constructor.add_sensing_start_date_filter(*value)
-        elif key == 'sensing_end_date':
-            query_constructor.add_sensing_end_date_filter(*value)
-        elif key == 'aoi':
-            query_constructor.add_aoi_filter(value)
-        elif key == 'cloud_cover':
-            query_constructor.add_cloud_cover_filter(value)
-        elif key == 'product_type':
-            query_constructor.add_product_type_filter(value)
-        elif key == 'attribute':
-            for item in value:
-                query_constructor.add_attribute_filter(**item)
+        if key in setters:
+            setters[key](value)
     
     return query_constructor
 
 
+@lru_cache(maxsize=8)
+def load_aoi(path):
+    """
+    Loads the first geometry of an AOI file. Cached so that each file is only
+    read once, independent of the number of test cases using it.
+    """
+
+    return gpd.read_file(path)['geometry'].values.tolist()[0]
+
+
+def create_fake_products(n_products):
+    """
+    Creates a list of minimal (but complete) products as returned by the API.
+    """
+
+    return [{'Id': f'00000000-0000-0000-0000-{i:012d}',
+             'Name': f'S2A_MSIL2A_20230101T102339_N0509_R065_T32UNU_{i:06d}.SAFE',
+             'ContentLength': 1024 * 1024,
+             'Online': True,
+             'PublicationDate': '2023-01-01T12:00:00.000Z',
+             'ContentDate': {'Start': '2023-01-01T10:23:39.024Z', 'End': '2023-01-01T10:23:39.024Z'},
+             'Footprint': "geography'SRID=4326;POLYGON ((11 49, 11.1 49, 11.1 49.1, 11 49.1, 11 49))'",
+             'Checksum': [{'Algorithm': 'MD5', 'Value': f'{i:032x}'}],
+             'Attributes': [{'Name': 'cloudCover', 'Value': 10.},
+                            {'Name': 'productType', 'Value': 'S2MSI2A'}]}
+            for i in range(n_products)]
+
+
+class FakeResponse:
+    """
+    Stands in for a requests.Response.
+    """
+
+    def __init__(self, result):
+        self._result = result
+
+    def json(self):
+        return self._result
+
+
+class FakeSession:
+    """
+    Stands in for the requests.Session of a QueryConstructor. Answers queries from
+    a fixed list of products based on the '$skip'/'$top' parameters (like the API,
+    returning 20 products if no '$top' is given) and records all requested URLs.
+    If count is False, the total number of products is never returned. If error is
+    provided, every request raises it instead.
+    """
+
+    def __init__(self, products, count=True, error=None):
+        self.products = products
+        self.count = count
+        self.error = error
+        self.urls = []
+
+    def get(self, url, timeout=None):
+        self.urls.append(url)
+        if self.error is not None:
+            raise self.error
+        params = dict(re.findall(r'\$(skip|top)=(\d+)', url))
+        skip = int(params.get('skip', 0))
+        top = int(params.get('top', 20))
+        result = {'value': self.products[skip:skip + top]}
+        if self.count and '$count=True' in url:
+            result['@odata.count'] = len(self.products)
+        return FakeResponse(result)
+
+
 # ### Test cases
 
 @pytest.fixture
@@ -73,8 +146,7 @@ def create_query_constructor_test_case(test_resources_dir):
     def _test_case(test_case):
         if test_case == 'test_case1':
             test_case = {}
-            gdf = gpd.read_file(os.path.join(test_resources_dir, 'aoi1_point.geojson'))
-            test_case['settings'] = {'aoi': gdf['geometry'].values.tolist()[0],
+            test_case['settings'] = {'aoi': load_aoi(os.path.join(test_resources_dir, 'aoi1_point.geojson')),
                                      'collection': 'sentinel-2',
                                      'product_type': 'l2a',
                                      'sensing_start_date': (datetime(2023, 7, 5), '2023-10-28T19:33:12.021Z'),
@@ -85,8 +157,7 @@ def create_query_constructor_test_case(test_resources_dir):
             test_case['nans'] = 0.04
         elif test_case == 'test_case2':
             test_case = {}
-            gdf = gpd.read_file(os.path.join(test_resources_dir, 'aoi1_point.geojson'))
-            test_case['settings'] = {'aoi': gdf['geometry'].values.tolist()[0],
+            test_case['settings'] = {'aoi': load_aoi(os.path.join(test_resources_dir, 'aoi1_point.geojson')),
                                      'collection': 's2',
                                      'product_type': 'level1c',
                                      'sensing_end_date': ('2020-05-01T03:24:33.998Z', '2020-08-11T22:00:11.633Z'),
@@ -97,8 +168,7 @@ def create_query_constructor_test_case(test_resources_dir):
             test_case['nans'] = 0.07
         elif test_case == 'test_case3':
             test_case = {}
-            gdf = gpd.read_file(os.path.join(test_resources_dir, 'aoi2_polygon.geojson'))
-            test_case['settings'] = {'aoi': gdf['geometry'].values.tolist()[0],
+            test_case['settings'] = {'aoi': load_aoi(os.path.join(test_resources_dir, 'aoi2_polygon.geojson')),
                                     'collection': 's1',
                                     'product_type': 'grd',
                                     'sensing_end_date': (datetime(2016, 9, 28), datetime(2016, 10, 23, 21, 31, 22)),
@@ -109,8 +179,7 @@ def create_query_constructor_test_case(test_resources_dir):
             test_case['nans'] = 0.04
         elif test_case == 'test_case4':
             test_case = {}
-            gdf = gpd.read_file(os.path.join(test_resources_dir, 'aoi3_self_intersecting_polygon.geojson'))
-            test_case['settings'] = {'aoi': gdf['geometry'].values.tolist()[0],
+            test_case['settings'] = {'aoi': load_aoi(os.path.join(test_resources_dir, 'aoi3_self_intersecting_polygon.geojson')),
                                      'collection': 'sentinel-1',
                                      'product_type': 'slc',
                                      'sensing_end_date': (datetime(2018, 8, 7, 0, 52, 11), datetime(2018, 8, 12)),
@@ -121,8 +190,7 @@ def create_query_constructor_test_case(test_resources_dir):
             test_case['nans'] = 0.04
         elif test_case == 'test_case5':
             test_case = {}
-            gdf = gpd.read_file(os.path.join(test_resources_dir, 'aoi4_multipolygon1.geojson'))
-            test_case['settings'] = {'aoi': gdf['geometry'].values.tolist()[0],
+            test_case['settings'] = {'aoi': load_aoi(os.path.join(test_resources_dir, 'aoi4_multipolygon1.geojson')),
                                     'collection': 'sentinel-3',
                                     'product_type': 'OL_2 lfr',
                                     'sensing_end_date': (datetime(2018, 8, 22, 0, 3, 56), datetime(2018, 9, 2, 23, 59, 59)),
@@ -135,8 +203,7 @@ def create_query_constructor_test_case(test_resources_dir):
             test_case['nans'] = 0.1
         elif test_case == 'test_case6':
             test_case = {}
-            gdf = gpd.read_file(os.path.join(test_resources_dir, 'aoi5_multipolygon2.geojson'))
-            test_case['settings'] = {'aoi': gdf['geometry'].values.tolist()[0],
+            test_case['settings'] = {'aoi': load_aoi(os.path.join(test_resources_dir, 'aoi5_multipolygon2.geojson')),
                                     'collection': 'sentinel-5p',
                                     'product_type': 'L2CH4',
                                     'sensing_end_date': (datetime(2021, 12, 15), datetime(2022, 1, 5, 23, 59, 59)),
@@ -146,8 +213,7 @@ def create_query_constructor_test_case(test_resources_dir):
             test_case['nans'] = 0.08
         elif test_case == 'test_case7':
             test_case = {}
-            gdf = gpd.read_file(os.path.join(test_resources_dir, 'aoi1_point.geojson'))
-            test_case['settings'] = {'aoi': gdf['geometry'].values.tolist()[0],
+            test_case['settings'] = {'aoi': load_aoi(os.path.join(test_resources_dir, 'aoi1_point.geojson')),
                                     'collection': 'l8',
                                     'product_type': 'L1 GT',
                                     'sensing_end_date': ('2015-05-05T19:33:12.021Z', datetime(2015, 6, 28)),
@@ -206,13 +272,202 @@ def test_query_constructor(test_case, create_query_constructor_test_case):
 
     # check that products dataframe does not contain a large number of NaNs (may
     # indicate problems with extracting additional columns)
-    assert float(np.sum(products.isna().values) / products.values.size) <= test_case['nans']
+    assert products.isna().to_numpy().mean() <= test_case['nans']
 
-    # verify that products property is the same as what is returned
-    products2 = qc.products
-    products[products.isna()] = 0.
+    # verify that products property is the same as what is returned (the property
+    # is already sorted by name; NaNs are considered equal)
     products = products.sort_values('Name').reset_index(drop=True)
-    products2[products2.isna()] = 0.
-    products2 = products2.sort_values('Name').reset_index(drop=True)
-    assert np.sum((products == products2).values) == products.values.size
+    pd.testing.assert_frame_equal(products, qc.products)
+
+
+# ### add_aoi_filter
+
+def test_add_aoi_filter_decimals():
+    """
+    Tests the coordinate precision of the AOI filter in the QueryConstructor class.
+    """
+
+    qc = QueryConstructor(decimals=6)
+    qc.add_aoi_filter(Point(13.123456789, 52.987654321), decimals=2)
+    assert "POINT (13.12 52.98)" in qc.query
+    qc.add_aoi_filter(Point(13.123456789, 52.987654321))
+    assert "POINT (13.123456 52.987654)" in qc.query
+
+
+# ### query
+
+def test_query_updated_by_filters():
+    """
+    Tests that the (cached) query of the QueryConstructor class is updated by every
+    filter method, including when an existing filter is overwritten.
+    """
+
+    qc = QueryConstructor()
+    filters = [lambda: qc.add_collection_filter('sentinel-2'),
+               lambda: qc.add_product_type_filter('l2a'),
+               lambda: qc.add_aoi_filter(Point(13.4, 52.5)),
+               lambda: qc.add_cloud_cover_filter(20),
+               lambda: qc.add_cloud_cover_filter((5, 30)),
+               lambda: qc.add_publication_date_filter(datetime(2023, 1, 1), datetime(2023, 2, 1)),
+               lambda: qc.add_sensing_start_date_filter(datetime(2023, 1, 1), datetime(2023, 2, 1)),
+               lambda: qc.add_sensing_end_date_filter(datetime(2023, 1, 1), datetime(2023, 2, 1)),
+               lambda: qc.add_attribute_filter('tileId', 'eq', '32UNU', 'String'),
+               lambda: qc.add_attribute_filter('orbitDirection', 'eq', 'ASCENDING', 'String'),
+               ]
+    queries = [qc.query]
+    for add_filter in filters:
+        add_filter()
+        assert qc.query != queries[-1]
+        queries.append(qc.query)
+
+
+# ### batch
+
+def test_batch():
+    """
+    Tests that QueryConstructor.batch checks the query only once after all filters
+    have been added and restores the interactive setting afterwards.
+    """
+
+    qc = QueryConstructor(interactive=True)
+    urls = []
+    qc._send_request = lambda url: urls.append(url) or {'value': [], '@odata.count': 5}
+
+    # fewer than three filters: no check at exit
+    with qc.batch():
+        qc.add_collection_filter('sentinel-2')
+        qc.add_product_type_filter('l2a')
+        assert not qc.interactive
+    assert qc.interactive
+    assert len(urls) == 0
+
+    # three or more filters: exactly one check at exit, none within the block
+    with qc.batch():
+        qc.add_cloud_cover_filter(20)
+        qc.add_aoi_filter(Point(13.4, 52.5))
+        assert len(urls) == 0
+    assert qc.interactive
+    assert len(urls) == 1
+
+    # interactive setting is restored if the block raises an error
+    with pytest.raises(ValueError):
+        with qc.batch():
+            qc.add_cloud_cover_filter(30)
+            raise ValueError
+    assert qc.interactive
+    assert len(urls) == 1
+
+
+# ### create_copy
+
+def test_create_copy():
+    """
+    Tests that QueryConstructor.create_copy carries over all settings and that
+    filters added to the copy do not change the original.
+    """
+
+    qc = QueryConstructor(request_timeout=30, max_retries=5, decimals=4, max_workers=2)
+    qc.add_collection_filter('sentinel-2')
+    qc.add_attribute_filter('orbitDirection', 'eq', 'ASCENDING', 'String')
+    query = qc.query
+    query_settings = copy.deepcopy(qc.query_settings)
+
+    qc_copy = qc.create_copy()
+    for attribute in ['interactive', 'request_timeout', 'max_retries', 'decimals', 'max_workers', 'query']:
+        assert getattr(qc_copy, attribute) == getattr(qc, attribute)
+
+    qc_copy.add_attribute_filter('tileId', 'eq', '32UNU', 'String')
+    assert qc_copy.query != query
+    assert qc.query == query
+    assert qc.query_settings == query_settings
+
+
+# ### send_query
+
+@pytest.mark.parametrize("n_products, skip, n_entries, offsets, result_offset", [(2345, 0, 1000, [0, 1000, 2000], 2000),
+                                                                                 (2345, 100, 1000, [100, 1100, 2100], 2100),
+                                                                                 (2345, 0, None, list(range(0, 2345, 20)), 2340),
+                                                                                 (500, 0, 1000, [0], 0),
+                                                                                 ])
+def test_send_query_pagination(n_products, skip, n_entries, offsets, result_offset):
+    """
+    Tests that QueryConstructor.send_query retrieves all pages of a query result
+    (each product exactly once) and returns the last page as raw result.
+    """
+
+    products = create_fake_products(n_products)
+    qc = QueryConstructor()
+    qc._session = FakeSession(products)
+    gdf, result = qc.send_query(skip=skip, n_entries=n_entries)
+
+    # one request per page; pages after the first are sent in parallel (any order)
+    assert len(qc._session.urls) == len(offsets)
+    assert sorted(int(re.search(r'\$skip=(\d+)', url).group(1)) for url in qc._session.urls) == offsets
+    assert gdf['Id'].is_unique
+    assert set(gdf['Id']) == {product['Id'] for product in products[skip:]}
+    assert result['value'][0]['Id'] == products[result_offset]['Id']
+
+
+def test_send_query_missing_count():
+    """
+    Tests that QueryConstructor.send_query raises a CopernicusQueryConstructorError
+    if the API result does not contain the total number of products.
+    """
+
+    qc = QueryConstructor()
+    qc._session = FakeSession(create_fake_products(10), count=False)
+    with pytest.raises(CopernicusQueryConstructorError):
+        qc.send_query()
+
+
+# ### products
+
+def test_products_copy():
+    """
+    Tests that changes to the table returned by QueryConstructor.products do not
+    affect the stored products.
+    """
+
+    qc = QueryConstructor()
+    qc._session = FakeSession(create_fake_products(10))
+    products = qc.products
+    products.drop(columns='Name', inplace=True)
+    assert 'Name' in qc.products.columns
+    assert qc.products['Name'].is_monotonic_increasing
+
+
+@pytest.mark.parametrize("aoi, aoi_coverage", [(box(11.02, 49.02, 11.08, 49.08), 1.),
+                                               (box(11.05, 49., 11.2, 49.1), 1 / 3),
+                                               (box(12., 49., 12.1, 49.1), 0.),
+                                               ])
+def test_products_aoi_coverage_geometry_collection(aoi, aoi_coverage):
+    """
+    Tests that the AOI coverage of GeometryCollection footprints is the same as
+    for the equivalent polygon footprints.
+    """
+
+    products = create_fake_products(2)
+    products[1]['Footprint'] = ("geography'SRID=4326;GEOMETRYCOLLECTION (POLYGON ((11 49, 11.1 49, 11.1 49.1, 11 49.1, 11 49)), "
+                                "LINESTRING (11 49, 11.1 49.1))'")
+    qc = QueryConstructor()
+    qc.add_aoi_filter(aoi)
+    qc._session = FakeSession(products)
+    assert qc.products['aoi_coverage'].to_numpy() == pytest.approx([aoi_coverage] * 2, abs=1e-3)
+
+
+# ### query_by_name
+
+@pytest.mark.parametrize("error", [requests.exceptions.RetryError('Max retries exceeded'),
+                                   requests.exceptions.JSONDecodeError('Expecting value', '', 0),
+                                   ])
+def test_query_by_name_request_error(error):
+    """
+    Tests that failed requests in QueryConstructor.query_by_name are raised as
+    CopernicusQueryConstructorError.
+    """
+
+    qc = QueryConstructor()
+    qc._session = FakeSession([], error=error)
+    with pytest.raises(CopernicusQueryConstructorError):
+        qc.query_by_name(['S2B_MSIL1C_20230101T102339_N0509_R065_T32UNU_20230101T105601.SAFE'])
 
@@ -14,12 +14,13 @@
 
 # #### Load packages and modules
 
-
+import pytest
 
 
 # ### Import packages and modules for unit testing
 
-from copernicusapi.src.query import interpret_collection_name, interpret_product_type
+from copernicusapi.src.query import interpret_collection_name, interpret_product_type, \
+reduce_wkt_coordinate_precision
 
 
 # ### Setting up packages and modules (optional)
@@ -29,6 +30,32 @@ from copernicusapi.src.query import interpret_collection_name, interpret_product
 
 # ### Test cases
 
+COLLECTION_NAME_TEST_CASES = [
+                              # Sentinel missions
+                              *[(f'{collection_root}{mission_number}', f'SENTINEL-{mission_number.upper()}')
+                                for mission_number in ('1', '2', '3', '5P', '6', '1-rtc')
+                                for collection_root in ('Sentinel', 'sentiNEL-', 'S', 's')],
+                              # Mosaics
+                              *[(collection, 'GLOBAL-MOSAICS') for collection in ('globalmosaics', 'Global-Mosaics')],
+                              # SMOS
+                              ('Smos', 'SMOS'),
+                              # ENVISAT
+                              ('envi-sat', 'ENVISAT'),
+                              # Landsat missions
+                              *[(f'{collection_root}{mission_number}', f'LANDSAT-{mission_number}')
+                                for mission_number in ('5', '7', '8')
+                                for collection_root in ('Landsat', 'LandSAT-', 'L', 'Ls')],
+                              # Copernicus DEM
+                              *[(collection, 'COP-DEM') for collection in ('cop DEM', 'CopernicusDEM')],
+                              # MODIS
+                              *[(collection, 'TERRAAQUA') for collection in ('Terra', 'AQUA', 'Terra_Aqua', 'Modis')],
+                              # Global Land Cover
+                              *[(collection, 'S2GLC') for collection in ('S-2 GLC', 'Global Land Cover', 'GLC')],
+                              # CCM
+                              *[(collection, 'CCM') for collection in ('ccm', 'Copernicus Contributing Missions')],
+                              ]
+
+
 PRODUCT_TYPE_TEST_CASES = {
                             # Sentinel-1 
                             'backscatter': 'CARD-BS',
@@ -87,6 +114,10 @@ PRODUCT_TYPE_TEST_CASES = {
                             'l1bra1': 'L1B_RA_BD1',
                             'RA3': 'L1B_RA_BD3',
                             'L1B RA5': 'L1B_RA_BD5',
+                            'l1brabd2': 'L1B_RA_BD2',
+                            'L1B RA BD8': 'L1B_RA_BD8',
+                            'ra9': None,
+                            'radiance': None,
                             'IR SIR': 'L1B_IR_SIR',
                             'L1B IRUVN': 'L1B_IR_UVN',
                             'L2 O3': 'L2__O3____',
@@ -107,6 +138,10 @@ PRODUCT_TYPE_TEST_CASES = {
                             'P4 2 LR': 'P4_2__LR_____',
                             'S-6 P4 2hr': 'P4_2__HR_____',
 
+                            # Sentinel-1 RTC
+                            'rtc': 'RTC',
+                            'Radiometric Terrain Corrected': 'RTC',
+
                             # Landsat-5
                             'l1g': 'L1G',
                             'level1g': 'L1G',
@@ -124,61 +159,51 @@ PRODUCT_TYPE_TEST_CASES = {
                             }
 
 
+WKT_PRECISION_TEST_CASES = [
+                            # (WKT string, decimals, expected result); decimals are cut off, not rounded
+                            ('POINT (11.0745119 49.4531109)', 6, 'POINT (11.074511 49.453110)'),
+                            ('POINT (11 49.5)', 2, 'POINT (11.00 49.50)'),
+                            ('POINT (-0.99999 1e-05)', 3, 'POINT (-0.999 0.000)'),
+                            ('POLYGON ((1.55 2.99, 3.12 4.01, 5.9 6.1, 1.55 2.99))', 0, 'POLYGON ((1 2, 3 4, 5 6, 1 2))'),
+                            ('POLYGON ((0 0, 10 0, 10 10, 0 10, 0 0), (1.25 1.25, 2.75 1.25, 2.75 2.75, 1.25 1.25))', 1,
+                             'POLYGON ((0.0 0.0, 10.0 0.0, 10.0 10.0, 0.0 10.0, 0.0 0.0), (1.2 1.2, 2.7 1.2, 2.7 2.7, 1.2 1.2))'),
+                            ('MULTIPOLYGON (((1.129 2.2, 3.3 4.4, 5.5 6.6, 1.129 2.2)), ((7.777 8.1, 9.1 1.1, 2.1 3.1, 7.777 8.1)))', 2,
+                             'MULTIPOLYGON (((1.12 2.20, 3.30 4.40, 5.50 6.60, 1.12 2.20)), ((7.77 8.10, 9.10 1.10, 2.10 3.10, 7.77 8.10)))'),
+                            ]
+
+
 # ---
 # ## Unit test definition
 
 # ### interpret_collection_name
 
-def test_interpret_collection_name():
+@pytest.mark.parametrize("input_name, output_name", COLLECTION_NAME_TEST_CASES)
+def test_interpret_collection_name(input_name, output_name):
     """
     Tests interpret_collection_name.
     """
 
-    # Sentinel missions
-    for mission_number in ('1', '2', '3', '5P', '6', '1-rtc'):
-        for collection_root in ('Sentinel', 'sentiNEL-', 'S', 's'):
-            assert interpret_collection_name(f'{collection_root}{mission_number}') == f'SENTINEL-{mission_number.upper()}'
-
-    # Mosaics
-    for collection in ('globalmosaics', 'Global-Mosaics'):
-        assert interpret_collection_name(collection) == 'GLOBAL-MOSAICS'
-
-    # SMOS
-    assert interpret_collection_name('Smos') == 'SMOS'
+    assert interpret_collection_name(input_name) == output_name
 
-    # ENVISAT
-    for collection in ('envi-sat', ):
-        assert interpret_collection_name(collection) == 'ENVISAT'
 
-    # Landsat missions
-    for mission_number in ('5', '7', '8'):
-        for collection_root in ('Landsat', 'LandSAT-', 'L', 'Ls'):
-            assert interpret_collection_name(f'{collection_root}{mission_number}') == f'LANDSAT-{mission_number}'
-    
-    # Copernicus DEM
-    for collection in ('cop DEM', 'CopernicusDEM'):
-        assert interpret_collection_name(collection) == 'COP-DEM'
-
-    # MODIS
-    for collection in ('Terra', 'AQUA', 'Terra_Aqua', 'Modis'):
-        assert interpret_collection_name(collection) == 'TERRAAQUA'
+# ### interpret_product_type
 
-    # Global Land Cover
-    for collection in ('S-2 GLC', 'Global Land Cover', 'GLC'):
-        assert interpret_collection_name(collection) == 'S2GLC'
+@pytest.mark.parametrize("input_name, output_name", PRODUCT_TYPE_TEST_CASES.items())
+def test_interpret_product_type(input_name, output_name):
+    """
+    Tests interpret_product_type.
+    """
 
-    # CCM
-    for collection in ('ccm', 'Copernicus Contributing Missions'):
-        assert interpret_collection_name(collection) == 'CCM'
+    assert interpret_product_type(input_name) == output_name
 
 
-# ### interpret_product_type
+# ### reduce_wkt_coordinate_precision
 
-def test_interpret_product_type():
+@pytest.mark.parametrize("wkt_str, decimals, expected_wkt_str", WKT_PRECISION_TEST_CASES)
+def test_reduce_wkt_coordinate_precision(wkt_str, decimals, expected_wkt_str):
     """
-    Tests interpret_product_type.
+    Tests reduce_wkt_coordinate_precision.
     """
 
-    for input_name, output_name in PRODUCT_TYPE_TEST_CASES.items():
-        assert interpret_product_type(input_name) == output_name
+    assert reduce_wkt_coordinate_precision(wkt_str, decimals=decimals) == expected_wkt_str
 
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Response Test
+# 
+# (c) 2024 Panopterra UG (haftungsbeschraenkt)
+# 
+# This file is part of the copernicusapi package and the copernicus-api repository
+# (https://github.com/panopterra/copernicus-api). It is released under the Apache
+# License Version 2.0. See the README.md file in the repository root directory or
+# go to http://www.apache.org/licenses/ for full license details.
+# 
+# ---
+
+# #### Load packages and modules
+
+import pytest
+
+
+# ### Import packages and modules for unit testing
+
+import numpy as np
+import pandas as pd
+
+from copernicusapi.src.response import get_checksums, get_product_values
+
+
+# ### Setting up packages and modules (optional)
+
+# ---
+# ## Unit test preparation
+
+# ### Test cases
+
+CHECKSUM_TEST_CASES = [
+                       ([], (None, None)),
+                       ([{}], (None, None)),
+                       ([{'Value': 'abc', 'Algorithm': 'MD5', 'ChecksumDate': '2023-01-01T11:06:49.520114Z'}], ('abc', None)),
+                       ([{'Value': 'abc', 'Algorithm': 'md5'}, {'Value': 'def', 'Algorithm': 'BLAKE3'}], ('abc', 'def')),
+                       ([{'Value': 'def', 'Algorithm': 'BLAKE3'}, {'Value': 'abc', 'Algorithm': 'MD5'}, {'Value': 'xyz', 'Algorithm': 'MD5'}], ('abc', 'def')),
+                       ([{'Value': 'abc', 'Algorithm': 'SHA256'}], (None, None)),
+                      ]
+
+PRODUCT_VALUES_TEST_CASE = pd.DataFrame({'Name': ['S2B_MSIL2A_20230101T102339_N0509_R065_T32UNU_20230101T120000.SAFE',
+                                                  'S1A_IW_GRDH_1SDV_20240208T053520_20240208T053545_052463_065842_F89D.SAFE'],
+                                         'Attributes': [[{'Name': 'cloudCover', 'Value': 12.5}, {'Name': 'productType', 'Value': 'S2MSI2A'}],
+                                                        [{'Name': 'productType', 'Value': 'IW_GRDH_1S'}, {'Name': 'productType', 'Value': 'other'}]],
+                                         'Checksum': [[{'Value': 'abc', 'Algorithm': 'MD5'}, {'Value': 'def', 'Algorithm': 'BLAKE3'}],
+                                                      [{}]]})
+
+
+# ---
+# ## Unit test definition
+
+# ### get_checksums
+
+@pytest.mark.parametrize("checksum_entry, expected_checksums", CHECKSUM_TEST_CASES)
+def test_get_checksums(checksum_entry, expected_checksums):
+    """
+    Tests get_checksums.
+    """
+
+    assert get_checksums(checksum_entry) == expected_checksums
+
+
+# ### get_product_values
+
+def test_get_product_values():
+    """
+    Tests get_product_values.
+    """
+
+    values = get_product_values(PRODUCT_VALUES_TEST_CASE)
+    assert values['cloud_cover'].iloc[0] == 12.5
+    assert np.isnan(values['cloud_cover'].iloc[1])
+    assert values['product_type'].tolist() == ['S2MSI2A', 'IW_GRDH_1S']
+    assert values['checksum_md5'].iloc[0] == 'abc'
+    assert values['checksum_blake3'].iloc[0] == 'def'
+    assert values[['checksum_md5', 'checksum_blake3']].iloc[1].isna().all()
+    assert values['group_tile_id'].tolist() == ['R065_T32UNU', '065842']
+
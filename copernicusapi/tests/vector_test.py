@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+# # Vector Test
+#
+# (c) 2024 Panopterra UG (haftungsbeschraenkt)
+#
+# This file is part of the copernicusapi package and the copernicus-api repository
+# (https://github.com/panopterra/copernicus-api). It is released under the Apache
+# License Version 2.0. See the README.md file in the repository root directory or
+# go to http://www.apache.org/licenses/ for full license details.
+#
+# ---
+
+# #### Load packages and modules
+
+import pytest
+
+
+# ### Import packages and modules for unit testing
+
+import numpy as np
+import shapely
+from shapely import Point, Polygon
+
+from copernicusapi.src.vector import reproject_geometry
+
+
+# ### Setting up packages and modules (optional)
+
+# ---
+# ## Unit test preparation
+
+# ### Test cases
+
+MIXED_Z_TEST_CASES = [
+                      [Point(10, 50), Point(10, 50, 100)],
+                      [Polygon([(10, 50), (11, 50), (11, 51)]), Polygon([(10, 50, 1), (11, 50, 1), (11, 51, 1)])],
+                      ]
+
+# equivalent definitions of WGS84 (EPSG 4326)
+CRS_TEST_CASES = [4326, 4326.0, 'EPSG:4326', {'proj': 'longlat', 'datum': 'WGS84'}]
+
+
+# ---
+# ## Unit test definition
+
+# ### reproject_geometry
+
+@pytest.mark.parametrize("geoms", MIXED_Z_TEST_CASES)
+def test_reproject_geometry_mixed_z(geoms):
+    """
+    Tests that reproject_geometry handles arrays of mixed 2D and 3D geometries
+    like reprojecting each geometry separately.
+    """
+
+    reprojected = reproject_geometry(np.array(geoms), 4326, 3857)
+    expected = [reproject_geometry(geom, 4326, 3857) for geom in geoms]
+
+    assert shapely.has_z(reprojected).tolist() == [False, True]
+    assert not np.isnan(shapely.get_coordinates(reprojected)).any()
+    assert shapely.equals_exact(reprojected, expected, tolerance=1e-6).all()
+
+
+@pytest.mark.parametrize("source_crs", CRS_TEST_CASES)
+def test_reproject_geometry_crs_input(source_crs):
+    """
+    Tests that reproject_geometry accepts CRS definitions in different formats
+    (including unhashable ones like dicts).
+    """
+
+    reprojected = reproject_geometry(Point(10, 50), source_crs, 3857)
+
+    assert reprojected.equals_exact(Point(1113194.908, 6446275.841), tolerance=1e-3)
+    assert reproject_geometry(reprojected, 3857, source_crs).equals_exact(Point(10, 50), tolerance=1e-6)
+